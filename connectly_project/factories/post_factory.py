@@ -16,8 +16,20 @@ class PostFactory:
         'poll': 'Interactive poll post'
     }
     
-    @staticmethod
-    def create_post(post_type, title=None, content='', author=None, metadata=None):
+    # Precomputed once so validation never rebuilds the key list
+    _VALID_TYPES = frozenset(POST_TYPES)
+    _VALID_TYPES_TUPLE = tuple(POST_TYPES)
+    
+    # Metadata keys each media post type must carry
+    _IMG_REQUIRED = frozenset(('file_size', 'file_type'))
+    _VID_REQUIRED = frozenset(('duration', 'file_size'))
+    _CREATE_REQUIRED = {
+        'image': _IMG_REQUIRED,
+        'video': _VID_REQUIRED,
+    }
+    
+    @classmethod
+    def create_post(cls, post_type, title=None, content='', author=None, metadata=None):
         """
         Create a post with type-specific validation and default values.
         
@@ -36,28 +48,22 @@ class PostFactory:
         """
         
         # Validate post type
-        if post_type not in PostFactory.POST_TYPES:
-            raise ValueError(f"Invalid post type. Must be one of: {list(PostFactory.POST_TYPES.keys())}")
+        if post_type not in cls._VALID_TYPES:
+            raise ValueError(f"Invalid post type. Must be one of: {cls._VALID_TYPES_TUPLE}")
         
         # Type-specific validation
-        if post_type == 'image' and metadata:
-            if 'file_size' not in metadata:
-                raise ValueError("Image posts require 'file_size' in metadata")
-            if 'file_type' not in metadata:
-                raise ValueError("Image posts require 'file_type' in metadata")
-        
-        if post_type == 'video' and metadata:
-            if 'duration' not in metadata:
-                raise ValueError("Video posts require 'duration' in metadata")
-            if 'file_size' not in metadata:
-                raise ValueError("Video posts require 'file_size' in metadata")
+        required = cls._CREATE_REQUIRED.get(post_type)
+        if required and metadata:
+            missing = required.difference(metadata)
+            if missing:
+                raise ValueError(f"{post_type.title()} posts require '{min(missing)}' in metadata")
         
         if post_type == 'article' and not title:
             raise ValueError("Article posts require a title")
         
         # Set default title based on post type
         if not title:
-            title = PostFactory._get_default_title(post_type)
+            title = cls._get_default_title(post_type)
         
         # Create the post with validated data
         post = Post.objects.create(
@@ -70,8 +76,8 @@ class PostFactory:
         
         return post
     
-    @staticmethod
-    def _get_default_title(post_type):
+    @classmethod
+    def _get_default_title(cls, post_type):
         """
         Generate default title based on post type.
         
@@ -91,18 +97,18 @@ class PostFactory:
         
         return default_titles.get(post_type, 'Untitled Post')
     
-    @staticmethod
-    def get_supported_types():
+    @classmethod
+    def get_supported_types(cls):
         """
         Get list of all supported post types.
         
         Returns:
             list: Available post types with descriptions
         """
-        return PostFactory.POST_TYPES
+        return cls.POST_TYPES
     
-    @staticmethod
-    def validate_post_data(post_type, data):
+    @classmethod
+    def validate_post_data(cls, post_type, data):
         """
         Validate post data based on type requirements.
         
@@ -119,58 +125,56 @@ class PostFactory:
                 return False, "Content is required for all post types"
             
             # Type-specific validation
-            if post_type == 'image':
-                return PostFactory._validate_image_post(data)
-            elif post_type == 'video':
-                return PostFactory._validate_video_post(data)
-            elif post_type == 'article':
-                return PostFactory._validate_article_post(data)
-            elif post_type == 'poll':
-                return PostFactory._validate_poll_post(data)
-            elif post_type == 'text':
-                return True, None  # Text posts are always valid with content
-            else:
-                return False, f"Invalid post type. Must be one of: {list(PostFactory.POST_TYPES.keys())}"
+            validator = cls._VALIDATORS.get(post_type)
+            if validator is None:
+                return False, f"Invalid post type. Must be one of: {cls._VALID_TYPES_TUPLE}"
+            
+            return validator(data)
                 
         except Exception as e:
             return False, f"Validation error: {str(e)}"
     
-    @staticmethod
-    def _validate_image_post(data):
+    @classmethod
+    def _validate_image_post(cls, data):
         """Validate image post specific requirements."""
-        metadata = data.get('metadata', {})
-        required_fields = ['file_size', 'file_type']
-        
-        for field in required_fields:
-            if field not in metadata:
-                return False, f"Image posts must include {field} in metadata"
+        missing = cls._IMG_REQUIRED.difference(data.get('metadata') or ())
+        if missing:
+            # min() keeps the reported field stable when several are missing
+            return False, f"Image posts must include {min(missing)} in metadata"
         
         return True, None
     
-    @staticmethod
-    def _validate_video_post(data):
+    @classmethod
+    def _validate_video_post(cls, data):
         """Validate video post specific requirements."""
-        metadata = data.get('metadata', {})
-        required_fields = ['duration', 'file_size']
-        
-        for field in required_fields:
-            if field not in metadata:
-                return False, f"Video posts must include {field} in metadata"
+        missing = cls._VID_REQUIRED.difference(data.get('metadata') or ())
+        if missing:
+            return False, f"Video posts must include {min(missing)} in metadata"
         
         return True, None
     
-    @staticmethod
-    def _validate_article_post(data):
+    @classmethod
+    def _validate_article_post(cls, data):
         """Validate article post specific requirements."""
         if not data.get('title'):
             return False, "Article posts must include a title"
         
         return True, None
     
-    @staticmethod
-    def _validate_poll_post(data):
+    @classmethod
+    def _validate_poll_post(cls, data):
         """Validate poll post specific requirements."""
         if not data.get('content'):
             return False, "Poll posts must include question content"
         
         return True, None
+
+
+# Type-specific validators, bound after the class body so the methods exist
+PostFactory._VALIDATORS = {
+    'text': lambda data: (True, None),  # Text posts are always valid with content
+    'image': PostFactory._validate_image_post,
+    'video': PostFactory._validate_video_post,
+    'article': PostFactory._validate_article_post,
+    'poll': PostFactory._validate_poll_post,
+}
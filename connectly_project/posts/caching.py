@@ -0,0 +1,15 @@
+from django.conf import settings
+
+
+# Post detail objects are cached per pk; posts.signals evicts them on save/delete
+POST_DETAIL_CACHE_TIMEOUT = 60
+
+
+def post_detail_cache_key(pk):
+    """Cache key under which PostDetailView stores a Post"""
+    return f'post:{pk}'
+
+
+def cache_enabled():
+    """Whether token and post-detail caching is on (requires a cache shared by all workers)"""
+    return getattr(settings, 'POSTS_CACHE_ENABLED', False)
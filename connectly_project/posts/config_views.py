@@ -2,18 +2,20 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.authentication import TokenAuthentication
+from posts.authentication import CachedTokenAuthentication
 from singletons.config_manager import ConfigManager
 
 
+_CONFIG = ConfigManager()
+
+
 class ConfigView(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         """Get current configuration settings"""
-        config = ConfigManager()
-        all_settings = config.get_all_settings()
+        all_settings = _CONFIG.get_all_settings()
         
         return Response({
             'message': 'Current configuration settings',
@@ -31,18 +33,18 @@ class ConfigView(APIView):
         if not request.user.is_staff:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         
-        config = ConfigManager()
         new_settings = request.data.get('settings', {})
+        valid_keys = _CONFIG.valid_keys
         
         # Update settings
         for key, value in new_settings.items():
-            if key in config.get_all_settings():
-                config.set_setting(key, value)
+            if key in valid_keys:
+                _CONFIG.set_setting(key, value)
         
         return Response({
             'message': 'Configuration updated successfully',
             'updated_settings': new_settings,
-            'current_settings': config.get_all_settings()
+            'current_settings': _CONFIG.get_all_settings()
         })
 
     def delete(self, request):
@@ -50,10 +52,9 @@ class ConfigView(APIView):
         if not request.user.is_staff:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         
-        config = ConfigManager()
-        config.reset_to_defaults()
+        _CONFIG.reset_to_defaults()
         
         return Response({
             'message': 'Configuration reset to defaults',
-            'default_settings': config.get_all_settings()
+            'default_settings': _CONFIG.get_all_settings()
         })
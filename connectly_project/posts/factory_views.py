@@ -2,51 +2,41 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.authentication import TokenAuthentication
+from posts.authentication import CachedTokenAuthentication
 from posts.models import Post
 from posts.serializers import PostSerializer
 from factories.post_factory import PostFactory
 from singletons.logger_singleton import LoggerSingleton
 
 
+_LOGGER = LoggerSingleton()
+
+
 class CreatePostView(APIView):
     """
     View for creating posts using the Factory Pattern.
     Provides type-specific validation and standardized post creation.
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        logger_singleton = LoggerSingleton()
-        logger = logger_singleton.get_logger()
-        
-        # Log post creation attempt
-        logger_singleton.log_api_request(
-            method="POST",
-            endpoint="/posts/create/",
-            user=request.user,
-            status_code=None  # Will be updated after processing
-        )
-        
         # Validate request data
         post_type = request.data.get('post_type', 'text')
         title = request.data.get('title')
         content = request.data.get('content', '')
         metadata = request.data.get('metadata', {})
         
+        # Each branch records its final status; one API log is written in finally
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        
         # Use factory for validation and creation
         try:
             # Validate data using factory
             is_valid, error_message = PostFactory.validate_post_data(post_type, request.data)
             
             if not is_valid:
-                logger_singleton.log_api_request(
-                    method="POST",
-                    endpoint="/posts/create/",
-                    user=request.user,
-                    status_code=400
-                )
+                status_code = status.HTTP_400_BAD_REQUEST
                 return Response({
                     'error': 'Validation failed',
                     'message': error_message,
@@ -73,14 +63,8 @@ class CreatePostView(APIView):
             }
             
             # Log successful creation
-            logger_singleton.log_api_request(
-                method="POST",
-                endpoint="/posts/create/",
-                user=request.user,
-                status_code=201
-            )
-            
-            logger_singleton.log_performance_metric(
+            status_code = status.HTTP_201_CREATED
+            _LOGGER.log_performance_metric(
                 metric_name="POST_CREATED",
                 value=1,
                 details=f"Post type: {post_type}, ID: {mock_post_id}"
@@ -95,13 +79,7 @@ class CreatePostView(APIView):
             }, status=status.HTTP_201_CREATED)
             
         except ValueError as e:
-            # Log validation error
-            logger_singleton.log_api_request(
-                method="POST",
-                endpoint="/posts/create/",
-                user=request.user,
-                status_code=400
-            )
+            status_code = status.HTTP_400_BAD_REQUEST
             return Response({
                 'error': 'Invalid post data',
                 'message': str(e),
@@ -109,27 +87,26 @@ class CreatePostView(APIView):
             }, status=status.HTTP_400_BAD_REQUEST)
             
         except Exception as e:
-            # Log unexpected error
-            logger_singleton.log_api_request(
-                method="POST",
-                endpoint="/posts/create/",
-                user=request.user,
-                status_code=500
-            )
+            # Unexpected error: status_code is still 500
             return Response({
                 'error': 'Internal server error',
                 'message': 'An unexpected error occurred while creating the post'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            
+        finally:
+            _LOGGER.log_api_request(
+                method="POST",
+                endpoint="/posts/create/",
+                user=request.user,
+                status_code=status_code
+            )
 
     def get(self, request):
         """
         Get information about supported post types and factory capabilities.
         """
-        logger_singleton = LoggerSingleton()
-        logger = logger_singleton.get_logger()
-        
         # Log information request
-        logger_singleton.log_api_request(
+        _LOGGER.log_api_request(
             method="GET",
             endpoint="/posts/create/",
             user=request.user,
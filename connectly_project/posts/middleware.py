@@ -1,47 +1,65 @@
 from django.utils.deprecation import MiddlewareMixin
 from django.http import HttpResponse
 from singletons.logger_singleton import LoggerSingleton
+import random
 import time
 
 
+# Path prefixes that bypass API logging
+_SKIPPED = ('/static/', '/admin/')
+
+# Requests slower than this are always logged
+_SLOW_REQUEST_SECONDS = 1.0
+
+# Fraction of fast successful requests that still get an API log record
+_LOG_SUCCESS_SAMPLE = 0.01
+
+
 class APILoggingMiddleware(MiddlewareMixin):
     """Middleware to log all API requests and responses"""
     
     def __init__(self, get_response):
         self.get_response = get_response
         self.logger_singleton = LoggerSingleton()
-        self.logger = self.logger_singleton.get_logger()
 
     def __call__(self, request):
         # Skip logging for static files and admin
-        if request.path.startswith('/static/') or request.path.startswith('/admin/'):
-            response = self.get_response(request)
-            return response
+        if request.path.startswith(_SKIPPED):
+            return self.get_response(request)
 
         # Log request
-        start_time = None
-        if hasattr(request, 'start_time'):
-            start_time = request.start_time
-        else:
-            start_time = time.time()
-            request.start_time = start_time
+        start_time = time.monotonic()
 
         # Process the request
         response = self.get_response(request)
 
         # Calculate response time
-        response_time = time.time() - start_time
+        response_time = time.monotonic() - start_time
+
+        # Fast successful requests are only sampled to keep the happy path cheap
+        if response.status_code < 400 and response_time <= _SLOW_REQUEST_SECONDS:
+            if random.random() < _LOG_SUCCESS_SAMPLE:
+                self.logger_singleton.log_api_request(
+                    method=request.method,
+                    endpoint=request.path,
+                    user=request.user if request.user.is_authenticated else None,
+                    status_code=response.status_code
+                )
+            return response
+
+        # Resolve the user once for every log record below
+        user = request.user if request.user.is_authenticated else None
 
         # Log the API request
         self.logger_singleton.log_api_request(
             method=request.method,
             endpoint=request.path,
-            user=request.user if request.user.is_authenticated else None,
+            user=user,
             status_code=response.status_code
         )
 
         # Log performance metrics for slow requests
-        if response_time > 1.0:  # Log requests taking more than 1 second
+        if response_time > _SLOW_REQUEST_SECONDS:
             self.logger_singleton.log_performance_metric(
                 metric_name="SLOW_REQUEST",
                 value=response_time,
@@ -54,19 +72,19 @@ class APILoggingMiddleware(MiddlewareMixin):
                 self.logger_singleton.log_security_event(
                     event_type="UNAUTHORIZED_ACCESS",
                     details=f"Unauthorized access attempt to {request.path}",
-                    user=request.user if request.user.is_authenticated else None
+                    user=user
                 )
             elif response.status_code == 403:
                 self.logger_singleton.log_security_event(
                     event_type="FORBIDDEN_ACCESS",
                     details=f"Forbidden access attempt to {request.path}",
-                    user=request.user if request.user.is_authenticated else None
+                    user=user
                 )
             elif response.status_code >= 500:
                 self.logger_singleton.log_security_event(
                     event_type="SERVER_ERROR",
                     details=f"Server error processing {request.path}",
-                    user=request.user if request.user.is_authenticated else None
+                    user=user
                 )
 
         return response
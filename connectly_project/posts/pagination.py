@@ -0,0 +1,64 @@
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db.models import Count, Window
+from rest_framework.pagination import PageNumberPagination
+from singletons.config_manager import ConfigManager
+
+
+_CONFIG = ConfigManager()
+
+
+class StandardPagination(PageNumberPagination):
+    """Page-number pagination sized by the DEFAULT_PAGE_SIZE config setting"""
+    # Used when DEFAULT_PAGE_SIZE isn't a positive int; a falsy size would
+    # turn pagination off and make list responses a bare list
+    page_size = 20
+
+    def get_page_size(self, request):
+        page_size = _CONFIG.snapshot().page_size
+        if isinstance(page_size, int) and not isinstance(page_size, bool) and page_size > 0:
+            return page_size
+        return self.page_size
+
+
+class WindowCountPaginator(Paginator):
+    """
+    Paginator that reads the total row count from a COUNT(*) OVER () window
+    annotation on the page query, so a page costs one query instead of two.
+    """
+
+    def page(self, number):
+        # Same checks and messages as validate_number(), minus its COUNT query
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+
+        # Fetch orphans extra rows so a short last page can be folded in
+        bottom = (number - 1) * self.per_page
+        rows = list(
+            self.object_list.annotate(_total_count=Window(expression=Count('*')))
+            [bottom:bottom + self.per_page + self.orphans]
+        )
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+
+        # count is a cached_property; assigning it stores the value on the
+        # instance, so num_pages/has_next read it without a COUNT query
+        self.count = rows[0]._total_count if rows else 0
+        if number > self.num_pages and not (number == 1 and self.allow_empty_first_page):
+            raise EmptyPage(self.error_messages['no_results'])
+
+        # Same page boundary as Paginator.page(), orphans included
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        return self._get_page(rows[:top - bottom], number, self)
+
+
+class WindowCountPagination(StandardPagination):
+    """StandardPagination that fetches the page and total count in one query"""
+    django_paginator_class = WindowCountPaginator
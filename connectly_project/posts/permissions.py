@@ -5,6 +5,17 @@ from rest_framework import status
 from rest_framework.permissions import BasePermission
 
 
+def _user_group_names(request):
+    """
+    Return the requesting user's group names, fetched once per request
+    """
+    names = getattr(request, '_group_names_cache', None)
+    if names is None:
+        names = frozenset(request.user.groups.values_list('name', flat=True))
+        request._group_names_cache = names
+    return names
+
+
 def require_group(group_name):
     """
     Decorator to require user to be in a specific group
@@ -13,13 +24,7 @@ def require_group(group_name):
         @wraps(view_func)
         @login_required
         def _wrapped_view(request, *args, **kwargs):
-            if not request.user.is_authenticated:
-                return JsonResponse(
-                    {'error': 'Authentication required'}, 
-                    status=status.HTTP_401_UNAUTHORIZED
-                )
-            
-            if not request.user.groups.filter(name=group_name).exists():
+            if group_name not in _user_group_names(request):
                 return JsonResponse(
                     {'error': f'Access denied. {group_name} role required.'}, 
                     status=status.HTTP_403_FORBIDDEN
@@ -38,13 +43,7 @@ def require_any_group(*group_names):
         @wraps(view_func)
         @login_required
         def _wrapped_view(request, *args, **kwargs):
-            if not request.user.is_authenticated:
-                return JsonResponse(
-                    {'error': 'Authentication required'}, 
-                    status=status.HTTP_401_UNAUTHORIZED
-                )
-            
-            if not request.user.groups.filter(name__in=group_names).exists():
+            if _user_group_names(request).isdisjoint(group_names):
                 return JsonResponse(
                     {'error': f'Access denied. One of these roles required: {", ".join(group_names)}'}, 
                     status=status.HTTP_403_FORBIDDEN
@@ -80,7 +79,7 @@ class IsAdminOrReadOnly(BasePermission):
         if request.method in ['GET', 'HEAD', 'OPTIONS']:
             return True
         
-        return request.user.is_authenticated and request.user.groups.filter(name='Admin').exists()
+        return request.user.is_authenticated and 'Admin' in _user_group_names(request)
 
 
 class IsAuthorOrReadOnly(BasePermission):
@@ -102,4 +101,4 @@ class IsModeratorOrAdmin(BasePermission):
         if not request.user.is_authenticated:
             return False
         
-        return request.user.groups.filter(name__in=['Moderator', 'Admin']).exists()
+        return not _user_group_names(request).isdisjoint(('Moderator', 'Admin'))
@@ -0,0 +1,37 @@
+import orjson
+from django.utils.http import parse_header_parameters
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class OrjsonRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+    Types orjson can't encode natively (Decimal, lazy strings, ...) fall back
+    to DRF's own JSONEncoder. orjson only indents by two spaces, so any
+    requested indent renders with two.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    _fallback = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        option = orjson.OPT_NAIVE_UTC
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=self._fallback, option=option)
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        # Same sources as JSONRenderer: "; indent=N" on the media type, then
+        # the indent BrowsableAPIRenderer passes in renderer_context
+        if accepted_media_type:
+            _, params = parse_header_parameters(accepted_media_type)
+            try:
+                return max(int(params['indent']), 0)
+            except (KeyError, ValueError, TypeError):
+                pass
+        return renderer_context.get('indent')
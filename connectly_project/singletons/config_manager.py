@@ -1,3 +1,10 @@
+from collections import namedtuple
+
+
+# Settings read on hot request paths, fetched together in one call
+ConfigSnapshot = namedtuple('ConfigSnapshot', ['page_size', 'rate_limit'])
+
+
 class ConfigManager:
     _instance = None
 
@@ -13,12 +20,32 @@ class ConfigManager:
             "ENABLE_ANALYTICS": True,
             "RATE_LIMIT": 100
         }
+        self.analytics_enabled = self.settings["ENABLE_ANALYTICS"]
+        self._snapshot = None
 
     def get_setting(self, key):
         return self.settings.get(key)
 
     def set_setting(self, key, value):
         self.settings[key] = value
+        self._snapshot = None
+        # Mirrored as a plain attribute for the per-request analytics gate
+        if key == "ENABLE_ANALYTICS":
+            self.analytics_enabled = value
+
+    def snapshot(self):
+        # Rebuilt lazily after set_setting/reset_to_defaults invalidate it
+        if self._snapshot is None:
+            self._snapshot = ConfigSnapshot(
+                page_size=self.settings.get("DEFAULT_PAGE_SIZE"),
+                rate_limit=self.settings.get("RATE_LIMIT"),
+            )
+        return self._snapshot
+
+    @property
+    def valid_keys(self):
+        # Set-like view of the setting names: O(1) membership without a copy
+        return self.settings.keys()
 
     def get_all_settings(self):
         return self.settings.copy()
@@ -1,6 +1,8 @@
+import atexit
 import logging
 import os
-from datetime import datetime
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 class LoggerSingleton:
@@ -20,9 +22,11 @@ class LoggerSingleton:
         log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'logs')
         os.makedirs(log_dir, exist_ok=True)
         
-        # Create file handler for persistent logging
+        # Create file handler for persistent logging (opened on first write)
         log_file = os.path.join(log_dir, 'api.log')
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=10 * 1024 * 1024, backupCount=5, delay=True
+        )
         
         # Create console handler for development
         console_handler = logging.StreamHandler()
@@ -34,9 +38,19 @@ class LoggerSingleton:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Requests only enqueue records; a background listener does the I/O
+        self._handlers = (file_handler, console_handler)
+        self._queue_handler = QueueHandler(queue.Queue(-1))
+        self.logger.addHandler(self._queue_handler)
+        self._start_listener()
+        
+        # A fork (e.g. gunicorn --preload) doesn't copy the listener thread,
+        # so each child process starts its own
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._start_listener)
+        
+        # Flush queued records on interpreter shutdown
+        atexit.register(self._stop_listener)
         
         # Set logging level
         self.logger.setLevel(logging.INFO)
@@ -44,45 +58,63 @@ class LoggerSingleton:
         # Prevent propagation to avoid duplicate logs
         self.logger.propagate = False
 
+    def _start_listener(self):
+        # Fresh queue too: one inherited from the parent may hold records or a locked mutex
+        self._queue_handler.queue = queue.Queue(-1)
+        self._listener = QueueListener(
+            self._queue_handler.queue, *self._handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def _stop_listener(self):
+        self._listener.stop()
+
     def get_logger(self):
         return self.logger
 
     def log_api_request(self, method, endpoint, user=None, status_code=None):
         """Log API requests with structured information"""
+        level = logging.ERROR if status_code and status_code >= 400 else logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
+
         log_data = {
-            'timestamp': datetime.now().isoformat(),
             'method': method,
             'endpoint': endpoint,
             'user': user.username if user else 'Anonymous',
             'status_code': status_code
         }
         
-        if status_code and status_code >= 400:
-            self.logger.error(f"API Error: {log_data}")
+        if level == logging.ERROR:
+            self.logger.error("API Error: %s", log_data)
         else:
-            self.logger.info(f"API Request: {log_data}")
+            self.logger.info("API Request: %s", log_data)
 
     def log_security_event(self, event_type, details, user=None):
         """Log security-related events"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+
         log_data = {
-            'timestamp': datetime.now().isoformat(),
             'event_type': event_type,
             'details': details,
             'user': user.username if user else 'Anonymous'
         }
         
-        self.logger.warning(f"Security Event: {log_data}")
+        self.logger.warning("Security Event: %s", log_data)
 
     def log_performance_metric(self, metric_name, value, details=None):
         """Log performance metrics"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         log_data = {
-            'timestamp': datetime.now().isoformat(),
             'metric': metric_name,
             'value': value,
             'details': details
         }
         
-        self.logger.info(f"Performance: {log_data}")
+        self.logger.info("Performance: %s", log_data)
 
     def set_log_level(self, level):
         """Dynamically change log level"""
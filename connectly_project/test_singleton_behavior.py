@@ -7,6 +7,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
 from singletons.config_manager import ConfigManager
+from singletons.logger_singleton import LoggerSingleton
 
 
 class TestConfigManagerSingleton(unittest.TestCase):
@@ -110,6 +111,63 @@ class TestConfigManagerSingleton(unittest.TestCase):
                           "Modifying returned dict shouldn't affect original")
         print("[PASS] Get all settings verified")
         
+    def test_valid_keys(self):
+        """Test that valid_keys tracks the current setting names"""
+        print("\nTesting Valid Keys...")
+        
+        config = ConfigManager()
+        config.reset_to_defaults()
+        
+        # Default settings should all be valid keys
+        for key in ["DEFAULT_PAGE_SIZE", "ENABLE_ANALYTICS", "RATE_LIMIT"]:
+            self.assertIn(key, config.valid_keys, f"{key} should be a valid key")
+        self.assertNotIn("NON_EXISTENT", config.valid_keys, 
+                         "Unknown settings should not be valid keys")
+        
+        # New settings and resets should be reflected without re-fetching
+        valid_keys = config.valid_keys
+        config.set_setting("VALID_KEY_TEST", 1)
+        self.assertIn("VALID_KEY_TEST", valid_keys, "valid_keys should be a live view")
+        config.reset_to_defaults()
+        self.assertNotIn("VALID_KEY_TEST", config.valid_keys, 
+                         "Reset should drop keys that are not defaults")
+        print("[PASS] Valid keys verified")
+        
+    def test_snapshot(self):
+        """Test that snapshot reflects the current hot-path settings"""
+        print("\nTesting Snapshot...")
+        
+        config = ConfigManager()
+        config.reset_to_defaults()
+        
+        # Defaults should be exposed as named fields
+        snapshot = config.snapshot()
+        self.assertEqual(snapshot.page_size, 20, "page_size should default to 20")
+        self.assertEqual(snapshot.rate_limit, 100, "rate_limit should default to 100")
+        self.assertIs(config.snapshot(), snapshot, "Unchanged settings should reuse the snapshot")
+        
+        # Updates and resets should invalidate the cached snapshot
+        config.set_setting("DEFAULT_PAGE_SIZE", 5)
+        self.assertEqual(config.snapshot().page_size, 5, "snapshot should see updated settings")
+        config.reset_to_defaults()
+        self.assertEqual(config.snapshot().page_size, 20, "snapshot should see reset settings")
+        print("[PASS] Snapshot verified")
+        
+    def test_analytics_enabled(self):
+        """Test that analytics_enabled mirrors the ENABLE_ANALYTICS setting"""
+        print("\nTesting Analytics Enabled...")
+        
+        config = ConfigManager()
+        config.reset_to_defaults()
+        self.assertTrue(config.analytics_enabled, "analytics_enabled should default to True")
+        
+        config.set_setting("ENABLE_ANALYTICS", False)
+        self.assertFalse(config.analytics_enabled, "analytics_enabled should follow set_setting")
+        
+        config.reset_to_defaults()
+        self.assertTrue(config.analytics_enabled, "analytics_enabled should follow reset_to_defaults")
+        print("[PASS] Analytics enabled verified")
+        
     def test_multiple_instantiations(self):
         """Test multiple instantiations across the application"""
         print("\nTesting Multiple Instantiations...")
@@ -131,6 +189,23 @@ class TestConfigManagerSingleton(unittest.TestCase):
         print("[PASS] Multiple instantiations verified")
 
 
+class TestLoggerSingleton(unittest.TestCase):
+    """Test the background log listener of LoggerSingleton"""
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "requires os.fork")
+    def test_listener_runs_after_fork(self):
+        """Test that a forked child drains its own log queue"""
+        logger = LoggerSingleton()
+        pid = os.fork()
+        if pid == 0:
+            thread = logger._listener._thread
+            os._exit(0 if thread is not None and thread.is_alive() else 1)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0,
+                        "Forked child should have a running log listener")
+        print("[PASS] Log listener restarted in forked child")
+
+
 def run_singleton_tests():
     """Run all Singleton pattern tests"""
     print("=" * 60)
@@ -1,33 +1,52 @@
 #!/usr/bin/env python3
 
-from OpenSSL import crypto
+import datetime
 import os
 
-# Generate key pair
-key = crypto.PKey()
-key.generate_key(crypto.TYPE_RSA, 2048)
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+# Reuse an existing key; RSA prime search is the slow part of this script.
+# RSA is kept over Ed25519 because browsers don't accept Ed25519 TLS certs.
+if os.path.exists("key.pem"):
+    with open("key.pem", "rb") as f:
+        key = serialization.load_pem_private_key(f.read(), password=None)
+else:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
 
 # Generate certificate
-cert = crypto.X509()
-cert.get_subject().C = "US"
-cert.get_subject().ST = "State"
-cert.get_subject().L = "City"
-cert.get_subject().O = "Organization"
-cert.get_subject().OU = "Organizational Unit"
-cert.get_subject().CN = "localhost"
-cert.set_serial_number(1)
-cert.gmtime_adj_notBefore(0)
-cert.gmtime_adj_notAfter(365*24*60*60)  # 1 year
-cert.set_issuer(cert.get_subject())
-cert.set_pubkey(key)
-cert.sign(key, 'sha256')
+subject = issuer = x509.Name([
+    x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+    x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "State"),
+    x509.NameAttribute(NameOID.LOCALITY_NAME, "City"),
+    x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Organization"),
+    x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, "Organizational Unit"),
+    x509.NameAttribute(NameOID.COMMON_NAME, "localhost"),
+])
+now = datetime.datetime.now(datetime.timezone.utc)
+cert = (
+    x509.CertificateBuilder()
+    .subject_name(subject)
+    .issuer_name(issuer)
+    .public_key(key.public_key())
+    .serial_number(1)
+    .not_valid_before(now)
+    .not_valid_after(now + datetime.timedelta(days=365))  # 1 year
+    .sign(key, hashes.SHA256())
+)
 
 # Write certificate and key to files
-with open("cert.pem", "wt") as f:
-    f.write(crypto.dump_certificate(crypto.FILETYPE_PEM, cert).decode())
+with open("cert.pem", "wb") as f:
+    f.write(cert.public_bytes(serialization.Encoding.PEM))
 
-with open("key.pem", "wt") as f:
-    f.write(crypto.dump_privatekey(crypto.FILETYPE_PEM, key).decode())
+with open("key.pem", "wb") as f:
+    f.write(key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ))
 
 print("Certificate and key generated successfully!")
 print("Files created: cert.pem, key.pem")